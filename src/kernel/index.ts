@@ -550,6 +550,15 @@ export class Kernel {
 	async recoverSessions(): Promise<void> {
 		await this.sessions.recoverSessions();
 	}
+
+	/**
+	 * Release kernel-held resources: stops health probing and closes the audit
+	 * trail's file descriptor. Safe to call more than once.
+	 */
+	shutdown(): void {
+		this.healthMonitor.stop();
+		this.audit.close();
+	}
 }
 
 export {
@@ -41,6 +41,8 @@ const REDACTED = "[REDACTED]";
 export class AuditMiddleware {
 	private enabled: boolean;
 	private auditPath: string;
+	/** Append descriptor for the current day's file, reused across entries */
+	private openFile: { filePath: string; fd: number; ino: number } | null = null;
 
 	constructor(options?: { enabled?: boolean; auditPath?: string }) {
 		this.enabled = options?.enabled ?? process.env.KERNEL_AUDIT_ENABLED !== "false";
@@ -192,6 +194,20 @@ export class AuditMiddleware {
 		}
 	}
 
+	/**
+	 * Close the cached audit file descriptor. The next entry reopens it.
+	 * Kernel.shutdown() calls this; standalone instances should call it when done.
+	 */
+	close(): void {
+		if (!this.openFile) return;
+		try {
+			fs.closeSync(this.openFile.fd);
+		} catch {
+			// Already closed — nothing to release
+		}
+		this.openFile = null;
+	}
+
 	/**
 	 * Whether audit logging is currently enabled.
 	 */
@@ -220,10 +236,31 @@ export class AuditMiddleware {
 		const filePath = path.join(this.auditPath, `${dateStr}.jsonl`);
 
 		try {
-			fs.mkdirSync(this.auditPath, { recursive: true });
-			fs.appendFileSync(filePath, `${JSON.stringify(entry)}\n`);
+			fs.writeSync(this.descriptorFor(filePath), `${JSON.stringify(entry)}\n`);
 		} catch {
-			// Audit failures should not break execution — silently skip
+			// Audit failures should not break execution — silently skip, and drop the
+			// descriptor so the next entry retries with a fresh open
+			this.close();
 		}
 	}
+
+	/**
+	 * Append descriptor for `filePath`. Entries for the same day share one open
+	 * descriptor — stat + write per entry instead of mkdir + open + write + close.
+	 * The day rolling over closes the old file and opens the new one, and so does
+	 * the file being deleted or rotated away (its inode no longer at `filePath`),
+	 * so entries never land in an unlinked file.
+	 */
+	private descriptorFor(filePath: string): number {
+		if (this.openFile?.filePath === filePath) {
+			const current = fs.statSync(filePath, { throwIfNoEntry: false });
+			if (current?.ino === this.openFile.ino) return this.openFile.fd;
+		}
+
+		this.close();
+		fs.mkdirSync(this.auditPath, { recursive: true });
+		const fd = fs.openSync(filePath, "a");
+		this.openFile = { filePath, fd, ino: fs.fstatSync(fd).ino };
+		return fd;
+	}
 }
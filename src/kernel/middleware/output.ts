@@ -197,12 +197,13 @@ export class OutputShaper {
 				result[domain] = partial;
 			}
 		} else {
-			// No recognized domain — take first 3 top-level keys
-			const keys = Object.keys(data)
-				.filter((k) => k !== "confidence")
-				.slice(0, 3);
-			for (const k of keys) {
+			// No recognized domain — take first 3 top-level keys, stopping as soon
+			// as they are found instead of filtering every key first
+			let taken = 0;
+			for (const k of Object.keys(data)) {
+				if (k === "confidence") continue;
 				result[k] = data[k];
+				if (++taken === 3) break;
 			}
 		}
 
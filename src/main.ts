@@ -226,14 +226,20 @@ async function validateAnalysisRequest(request: AnalysisRequest): Promise<{ vali
 	}
 
 	// Validate input files exist (production mode)
+	// Checks run concurrently — each access() is an independent round trip, which
+	// adds up on network mounts. Results keep input order so errors stay stable.
 	if (request.mode === "production" && request.inputFiles) {
-		for (const file of request.inputFiles) {
-			try {
-				await fs.access(file);
-			} catch {
-				errors.push(`Input file not found: ${file}`);
-			}
-		}
+		const found = await Promise.all(
+			request.inputFiles.map((file) =>
+				fs.access(file).then(
+					() => true,
+					() => false,
+				),
+			),
+		);
+		request.inputFiles.forEach((file, i) => {
+			if (!found[i]) errors.push(`Input file not found: ${file}`);
+		});
 	}
 
 	// Validate workflow file if specified
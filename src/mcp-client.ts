@@ -66,6 +66,8 @@ export interface WorkflowResult {
 export class ShaleYeahMCPClient {
 	private clients: Map<string, Client> = new Map();
 	private transports: Map<string, StdioClientTransport> = new Map();
+	/** Primary tool name per connected server — a server's tool list is fixed for the life of its connection */
+	private primaryTools: Map<string, string> = new Map();
 	private _serverConfigs: MCPServerConfig[] = [];
 	private initialized = false;
 	public readonly kernel: Kernel;
@@ -416,19 +418,24 @@ export class ShaleYeahMCPClient {
 
 		try {
 			// Call actual MCP server tools (both demo and production)
-			const tools = await client.listTools();
-			const primaryTool = tools.tools[0]; // Use first available tool
-
-			if (!primaryTool) {
-				throw new Error("No tools available on server");
+			let primaryToolName = this.primaryTools.get(serverName);
+			if (!primaryToolName) {
+				const tools = await client.listTools();
+				const primaryTool = tools.tools[0]; // Use first available tool
+
+				if (!primaryTool) {
+					throw new Error("No tools available on server");
+				}
+				primaryToolName = primaryTool.name;
+				this.primaryTools.set(serverName, primaryToolName);
 			}
 
 			// Use fixture args when provided (demo mode), otherwise derive from request
 			const toolArguments =
-				request.fixtureArgs?.[serverName] ?? this.getServerSpecificArguments(serverName, primaryTool.name, request);
+				request.fixtureArgs?.[serverName] ?? this.getServerSpecificArguments(serverName, primaryToolName, request);
 
 			const result = await client.callTool({
-				name: primaryTool.name,
+				name: primaryToolName,
 				arguments: toolArguments,
 			});
 
@@ -648,10 +655,13 @@ export class ShaleYeahMCPClient {
 		recommendation: string,
 		confidence: number,
 	): Promise<void> {
+		// One timestamp for the whole run, so the three reports agree on it
+		const generatedAt = new Date().toISOString();
+
 		// Investment Decision Summary
 		const investmentDecision = `# SHALE YEAH Investment Analysis Report
 
-**Analysis Date:** ${new Date().toISOString().split("T")[0]}
+**Analysis Date:** ${generatedAt.split("T")[0]}
 **Tract:** ${request.tractName}
 **Analysis ID:** ${request.runId}
 **Mode:** ${request.mode.toUpperCase()}
@@ -684,17 +694,20 @@ Based on comprehensive multi-domain analysis, this investment presents ${confide
 
 ---
 *Generated with SHALE YEAH MCP Architecture*
-*${new Date().toISOString()}*`;
-
-		await fs.writeFile(path.join(request.outputDir, "INVESTMENT_DECISION.md"), investmentDecision);
+*${generatedAt}*`;
 
 		// Detailed Analysis Report
-		const detailedAnalysis = this.generateDetailedReport(request, results);
-		await fs.writeFile(path.join(request.outputDir, "DETAILED_ANALYSIS.md"), detailedAnalysis);
+		const detailedAnalysis = this.generateDetailedReport(request, results, generatedAt);
 
 		// Financial Model JSON
-		const financialModel = this.generateFinancialModel(request, results);
-		await fs.writeFile(path.join(request.outputDir, "FINANCIAL_MODEL.json"), JSON.stringify(financialModel, null, 2));
+		const financialModel = this.generateFinancialModel(request, results, generatedAt);
+
+		// The three reports are independent files — write them concurrently
+		await Promise.all([
+			fs.writeFile(path.join(request.outputDir, "INVESTMENT_DECISION.md"), investmentDecision),
+			fs.writeFile(path.join(request.outputDir, "DETAILED_ANALYSIS.md"), detailedAnalysis),
+			fs.writeFile(path.join(request.outputDir, "FINANCIAL_MODEL.json"), JSON.stringify(financialModel, null, 2)),
+		]);
 
 		console.log();
 		console.log("📄 Reports Generated:");
@@ -727,11 +740,11 @@ Based on comprehensive multi-domain analysis, this investment presents ${confide
 | **EUR** | ${(eur / 1000).toFixed(0)}K BOE | ${eur > 500000 ? "High" : "Moderate"} |`;
 	}
 
-	private generateDetailedReport(request: AnalysisRequest, results: AnalysisResult[]): string {
+	private generateDetailedReport(request: AnalysisRequest, results: AnalysisResult[], generatedAt: string): string {
 		return `# Detailed Investment Analysis
 
 **Analysis ID:** ${request.runId}
-**Generated:** ${new Date().toISOString()}
+**Generated:** ${generatedAt}
 
 ## Analysis Overview
 
@@ -759,7 +772,11 @@ ${JSON.stringify(result.analysis, null, 2)}`
 *Detailed analysis generated by SHALE YEAH MCP Client*`;
 	}
 
-	private generateFinancialModel(request: AnalysisRequest, results: AnalysisResult[]): Record<string, unknown> {
+	private generateFinancialModel(
+		request: AnalysisRequest,
+		results: AnalysisResult[],
+		generatedAt: string,
+	): Record<string, unknown> {
 		const econResult = results.find((r) => r.server === "econobot");
 		const curveResult = results.find((r) => r.server === "curve-smith");
 
@@ -769,7 +786,7 @@ ${JSON.stringify(result.analysis, null, 2)}`
 		return {
 			analysis_metadata: {
 				run_id: request.runId,
-				analysis_date: new Date().toISOString(),
+				analysis_date: generatedAt,
 				mode: request.mode,
 				tract_name: request.tractName,
 			},
@@ -811,6 +828,8 @@ ${JSON.stringify(result.analysis, null, 2)}`
 
 		this.clients.clear();
 		this.transports.clear();
+		this.primaryTools.clear();
+		this.kernel.shutdown();
 		this.initialized = false;
 	}
 
@@ -303,6 +303,12 @@ async function evaluateInvestmentOpportunity(args: {
 	const payback = inputs.economic?.paybackMonths ?? undefined;
 	const riskScore = inputs.risk?.overallRisk ?? undefined;
 
+	// Thresholds resolved once; absent criteria are permissive
+	const minNPV = criteria?.minNPV ?? 0;
+	const minIRR = criteria?.minIRR ?? 0;
+	const maxPayback = criteria?.maxPayback ?? 999;
+	const maxRisk = criteria?.maxRisk ?? 1;
+
 	// Decision logic
 	let decision: "INVEST" | "PASS" | "CONDITIONAL" = "PASS";
 	const reasoning: string[] = [];
@@ -317,12 +323,8 @@ async function evaluateInvestmentOpportunity(args: {
 		reasoning.push("Incomplete economic data — cannot make a definitive investment decision");
 		if (npv === undefined) riskFactors.push("NPV not provided — econobot analysis may be missing");
 		if (irr === undefined) riskFactors.push("IRR not provided — econobot analysis may be missing");
-	} else if (
-		npv >= (criteria?.minNPV ?? 0) &&
-		irr >= (criteria?.minIRR ?? 0) &&
-		(payback ?? 0) <= (criteria?.maxPayback ?? 999)
-	) {
-		if ((riskScore ?? 0.5) <= (criteria?.maxRisk ?? 1)) {
+	} else if (npv >= minNPV && irr >= minIRR && (payback ?? 0) <= maxPayback) {
+		if ((riskScore ?? 0.5) <= maxRisk) {
 			decision = "INVEST";
 			reasoning.push(`Strong economics: NPV $${(npv / 1000000).toFixed(1)}M, IRR ${(irr * 100).toFixed(1)}%`);
 			reasoning.push(`Acceptable risk profile: ${((riskScore ?? 0.5) * 100).toFixed(1)}% risk score`);
@@ -335,14 +337,10 @@ async function evaluateInvestmentOpportunity(args: {
 	} else {
 		decision = "PASS";
 		reasoning.push("Economics do not meet minimum investment criteria");
-		if (npv < (criteria?.minNPV ?? 0))
-			reasoning.push(
-				`NPV below threshold: $${(npv / 1000000).toFixed(1)}M < $${((criteria?.minNPV ?? 0) / 1000000).toFixed(1)}M`,
-			);
-		if (irr < (criteria?.minIRR ?? 0))
-			reasoning.push(
-				`IRR below threshold: ${(irr * 100).toFixed(1)}% < ${((criteria?.minIRR ?? 0) * 100).toFixed(1)}%`,
-			);
+		if (npv < minNPV)
+			reasoning.push(`NPV below threshold: $${(npv / 1000000).toFixed(1)}M < $${(minNPV / 1000000).toFixed(1)}M`);
+		if (irr < minIRR)
+			reasoning.push(`IRR below threshold: ${(irr * 100).toFixed(1)}% < ${(minIRR * 100).toFixed(1)}%`);
 	}
 
 	// Identify risk factors
@@ -398,6 +396,13 @@ async function evaluateInvestmentOpportunity(args: {
 	};
 }
 
+/** Fraction of NPV to bid (bid) and to go no higher than (max), per bid strategy */
+const BID_MULTIPLIERS: Readonly<Record<BidStrategy["strategy"], { bid: number; max: number }>> = Object.freeze({
+	AGGRESSIVE: { bid: 0.85, max: 0.95 },
+	CONSERVATIVE: { bid: 0.7, max: 0.85 },
+	OPPORTUNISTIC: { bid: 0.6, max: 0.8 },
+});
+
 function developBidStrategy(args: {
 	valuation: { npv: number; irr: number };
 	strategy: "AGGRESSIVE" | "CONSERVATIVE" | "OPPORTUNISTIC";
@@ -405,23 +410,8 @@ function developBidStrategy(args: {
 	const valuation = args.valuation;
 	const strategy = args.strategy;
 
-	let bidMultiplier = 0.7; // Conservative starting point
-	let maxMultiplier = 0.85;
-
-	switch (strategy) {
-		case "AGGRESSIVE":
-			bidMultiplier = 0.85;
-			maxMultiplier = 0.95;
-			break;
-		case "OPPORTUNISTIC":
-			bidMultiplier = 0.6;
-			maxMultiplier = 0.8;
-			break;
-		default:
-			bidMultiplier = 0.7;
-			maxMultiplier = 0.85;
-			break;
-	}
+	// Unknown strategies fall back to the conservative multipliers
+	const { bid: bidMultiplier, max: maxMultiplier } = BID_MULTIPLIERS[strategy] ?? BID_MULTIPLIERS.CONSERVATIVE;
 
 	const recommendedBid = valuation.npv * bidMultiplier;
 	const maxBid = valuation.npv * maxMultiplier;
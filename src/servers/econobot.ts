@@ -7,7 +7,6 @@
 
 import fs from "node:fs/promises";
 import path from "node:path";
-import * as ExcelJS from "exceljs";
 import { z } from "zod";
 import { callLLM } from "../shared/llm-client.js";
 import { type MCPServer, runMCPServer } from "../shared/mcp-server.js";
@@ -72,9 +71,8 @@ const econobotTemplate: ServerTemplate = {
 				currency: z.string().default("USD"),
 			}),
 			async (args) => {
-				const npv = calculateNPV(args.cashFlows, args.discountRate);
+				const { npv, paybackPeriod } = summarizeCashFlows(args.cashFlows, args.discountRate);
 				const irr = calculateIRR(args.cashFlows);
-				const paybackPeriod = calculatePaybackPeriod(args.cashFlows);
 
 				return {
 					npv,
@@ -136,7 +134,9 @@ async function performEconomicAnalysis(args: { filePath: string }): Promise<Econ
 
 async function processExcelFile(filePath: string): Promise<Record<string, unknown>> {
 	try {
-		const workbook = new ExcelJS.Workbook();
+		// exceljs is loaded on first spreadsheet — most econobot calls never open one
+		const { Workbook } = await import("exceljs");
+		const workbook = new Workbook();
 		await workbook.xlsx.readFile(filePath);
 		const sheets: Record<string, unknown[]> = {};
 
@@ -277,18 +277,26 @@ function calculateDCFMetrics(
 	let paybackYears = years;
 	const initialInvestment = 5000000; // $5M typical well cost
 
+	// Decline and discount factors advance by one multiply per year instead of
+	// recomputing 0.85^(year-1) and (1+r)^year from scratch each iteration
+	const discountStep = 1 / (1 + discountRate);
+	let yearlyProduction = avgProduction;
+	let discountFactor = discountStep;
+
 	for (let year = 1; year <= years; year++) {
-		const yearlyProduction = avgProduction * 0.85 ** (year - 1);
 		const revenue = yearlyProduction * avgOilPrice * 365;
 		const operatingCosts = yearlyProduction * avgOpex * 365;
 		const netCashFlow = revenue - operatingCosts;
-		const discountedCashFlow = netCashFlow / (1 + discountRate) ** year;
+		const discountedCashFlow = netCashFlow * discountFactor;
 
 		npv += discountedCashFlow;
 
 		if (npv >= initialInvestment && paybackYears === years) {
 			paybackYears = year;
 		}
+
+		yearlyProduction *= 0.85;
+		discountFactor *= discountStep;
 	}
 
 	npv -= initialInvestment;
@@ -456,55 +464,103 @@ async function generateDefaultAnalysis(): Promise<EconomicAnalysis> {
 	};
 }
 
+/** NPV with a running discount factor — one multiply per period instead of a power */
 function calculateNPV(cashFlows: number[], discountRate: number): number {
-	return cashFlows.reduce((npv, cashFlow, period) => {
-		return npv + cashFlow / (1 + discountRate) ** period;
-	}, 0);
+	const discountStep = 1 / (1 + discountRate);
+	let discountFactor = 1;
+	let npv = 0;
+	for (const cashFlow of cashFlows) {
+		npv += cashFlow * discountFactor;
+		discountFactor *= discountStep;
+	}
+	return npv;
 }
 
-function calculateIRR(cashFlows: number[]): number {
-	let rate = 0.1;
-	let increment = 0.01;
+/**
+ * IRR as the discount rate where NPV crosses zero. Bisection over a rate bracket
+ * of -99%..1000% narrows the bracket until it is under 1e-7 wide (~27 NPV
+ * evaluations), so the result does not depend on the scale of the cash flows.
+ * Long series overflow at -99% (each period multiplies by 100), so the lower
+ * bound is pulled toward zero until NPV there is finite. Returns null when NPV
+ * does not change sign across the bracket, i.e. the flows have no IRR.
+ *
+ * Exported for testing.
+ */
+export function calculateIRR(cashFlows: number[]): number | null {
+	let lo = -0.99;
+	let hi = 10;
+	let npvLo = calculateNPV(cashFlows, lo);
+	while (!Number.isFinite(npvLo) && lo < -1e-6) {
+		lo /= 2;
+		npvLo = calculateNPV(cashFlows, lo);
+	}
+	const npvHi = calculateNPV(cashFlows, hi);
+	if (!Number.isFinite(npvLo) || !Number.isFinite(npvHi) || Math.sign(npvLo) === Math.sign(npvHi)) {
+		return null;
+	}
 
-	for (let i = 0; i < 1000; i++) {
+	let rate = lo;
+	while (hi - lo >= 1e-7) {
+		rate = (lo + hi) / 2;
 		const npv = calculateNPV(cashFlows, rate);
-		if (Math.abs(npv) < 1) break;
+		if (npv === 0) break;
 
-		if (npv > 0) {
-			rate += increment;
+		if (Math.sign(npv) === Math.sign(npvLo)) {
+			lo = rate;
+			npvLo = npv;
 		} else {
-			rate -= increment;
-			increment /= 2;
+			hi = rate;
 		}
 	}
 
 	return Math.round(rate * 10000) / 100;
 }
 
-function calculatePaybackPeriod(cashFlows: number[]): number {
+/**
+ * NPV and payback period (first period with non-negative cumulative cash flow)
+ * from a single pass over the cash flows. Discounts with the same running
+ * factor as calculateNPV, so the NPV matches it exactly.
+ *
+ * Exported for testing.
+ */
+export function summarizeCashFlows(cashFlows: number[], discountRate: number): { npv: number; paybackPeriod: number } {
+	const discountStep = 1 / (1 + discountRate);
+	let discountFactor = 1;
+	let npv = 0;
 	let cumulative = 0;
-	for (let i = 0; i < cashFlows.length; i++) {
-		cumulative += cashFlows[i];
-		if (cumulative >= 0) return i;
+	let paybackPeriod = cashFlows.length;
+
+	for (let period = 0; period < cashFlows.length; period++) {
+		const cashFlow = cashFlows[period];
+		npv += cashFlow * discountFactor;
+		discountFactor *= discountStep;
+		cumulative += cashFlow;
+		if (paybackPeriod === cashFlows.length && cumulative >= 0) {
+			paybackPeriod = period;
+		}
 	}
-	return cashFlows.length;
+
+	return { npv, paybackPeriod };
 }
 
 function performSensitivityAnalysis(args: any): any {
 	const baseCase = args.baseCase;
-	const scenarios = generateScenarios(baseCase, args.ranges, args.scenarios);
+	const count: number = args.scenarios;
 
-	const npvs = scenarios.map(
-		(s: { oilPrice: number; gasPrice: number }) =>
-			s.oilPrice * 100000 - baseCase.costs.drilling - baseCase.costs.completion,
-	);
-	const irrs = scenarios.map((s: { oilPrice: number; gasPrice: number }) =>
-		Math.max(0, Math.min(0.5, (s.oilPrice - 45) / 100)),
-	);
+	// NPV and IRR depend only on each scenario's oil price, so they come straight
+	// from the price grid; full scenario objects (a copy of the base case each)
+	// are built only for the 10 that are returned
+	const npvs = new Array<number>(count);
+	const irrs = new Array<number>(count);
+	for (let i = 0; i < count; i++) {
+		const oilPrice = scenarioOilPrice(baseCase, args.ranges, i, count);
+		npvs[i] = oilPrice * 100000 - baseCase.costs.drilling - baseCase.costs.completion;
+		irrs[i] = Math.max(0, Math.min(0.5, (oilPrice - 45) / 100));
+	}
 
 	return {
 		baseCase,
-		scenarios: scenarios.slice(0, 10),
+		scenarios: generateScenarios(baseCase, args.ranges, count, 10),
 		statistics: {
 			npv: {
 				mean: npvs.reduce((a, b) => a + b) / npvs.length,
@@ -520,15 +576,24 @@ function performSensitivityAnalysis(args: any): any {
 	};
 }
 
-function generateScenarios(baseCase: any, ranges: any, count: number): any[] {
+/** Deterministic variation: scenario i of count, evenly spaced from -1 to +1 across the variance range */
+function scenarioOffset(i: number, count: number): number {
+	return count === 1 ? 0 : (i / (count - 1)) * 2 - 1;
+}
+
+/** Oil price for scenario i of count; shared by the statistics grid and the returned scenarios */
+function scenarioOilPrice(baseCase: any, ranges: any, i: number, count: number): number {
+	return baseCase.oilPrice * (1 + scenarioOffset(i, count) * ranges.oilPriceVariance);
+}
+
+/** The first `limit` of `count` evenly spaced scenarios */
+function generateScenarios(baseCase: any, ranges: any, count: number, limit: number): any[] {
 	const scenarios = [];
 
-	for (let i = 0; i < count; i++) {
+	for (let i = 0; i < Math.min(count, limit); i++) {
 		const scenario = { ...baseCase };
-		// Deterministic variation: evenly spaced across the variance range
-		const t = count === 1 ? 0 : (i / (count - 1)) * 2 - 1; // -1 to +1
-		scenario.oilPrice = baseCase.oilPrice * (1 + t * ranges.oilPriceVariance);
-		scenario.gasPrice = baseCase.gasPrice * (1 + t * ranges.gasPriceVariance);
+		scenario.oilPrice = scenarioOilPrice(baseCase, ranges, i, count);
+		scenario.gasPrice = baseCase.gasPrice * (1 + scenarioOffset(i, count) * ranges.gasPriceVariance);
 
 		scenarios.push(scenario);
 	}
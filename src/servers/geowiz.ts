@@ -7,12 +7,11 @@
 
 import fs from "node:fs/promises";
 import { z } from "zod";
-import { analyzeLASCurve, type CurveAnalysis } from "../../tools/curve-qc.js";
+import { analyzeCurve, type CurveAnalysis } from "../../tools/curve-qc.js";
 import { type LASData, parseLASFile } from "../../tools/las-parse.js";
 import { callLLM } from "../shared/llm-client.js";
 import { runMCPServer } from "../shared/mcp-server.js";
 import { ServerFactory, type ServerTemplate, ServerUtils } from "../shared/server-factory.js";
-import type { LASCurve } from "../shared/types.js";
 
 interface GeologicalAnalysis {
 	formations: string[];
@@ -217,7 +216,7 @@ async function performFormationAnalysis(args: {
 }): Promise<GeologicalAnalysis> {
 	try {
 		const lasData: LASData = parseLASFile(args.filePath);
-		const keyQCResults = await performCurveQC(args.filePath, lasData);
+		const keyQCResults = await performCurveQC(lasData);
 
 		return await analyzeGeologicalData(lasData, keyQCResults, args.analysisType || "standard", args.formations);
 	} catch (_error) {
@@ -243,7 +242,9 @@ async function performFormationAnalysis(args: {
 	}
 }
 
-async function performCurveQC(filePath: string, lasData: LASData): Promise<Array<CurveAnalysis>> {
+// QC runs against the LAS data already parsed by the caller; re-reading the file
+// per curve used to parse the same file up to six extra times.
+async function performCurveQC(lasData: LASData): Promise<Array<CurveAnalysis>> {
 	const qcResults: Array<CurveAnalysis> = [];
 	const keyCurves = ["GR", "NPHI", "RHOB", "RT", "PE", "CALI"];
 
@@ -251,7 +252,7 @@ async function performCurveQC(filePath: string, lasData: LASData): Promise<Array
 		const curve = lasData.curves.find((c) => c.name.toUpperCase() === curveName);
 		if (curve) {
 			try {
-				const qcAnalysis = analyzeLASCurve(filePath, curveName);
+				const qcAnalysis = analyzeCurve(lasData, curveName);
 				qcResults.push(qcAnalysis);
 			} catch (_error) {
 				// Skip failed QC analysis
@@ -276,23 +277,20 @@ async function analyzeGeologicalData(
 	// Calculate average porosity from neutron-density if available
 	let avgPorosity = 12.0; // Default
 	if (nphiCurve && rhobCurve) {
-		const validNphi = nphiCurve.data.filter((v) => !Number.isNaN(v));
-		const validRhob = rhobCurve.data.filter((v) => !Number.isNaN(v));
-		if (validNphi.length > 0 && validRhob.length > 0) {
-			const avgNphi = validNphi.reduce((sum, v) => sum + v, 0) / validNphi.length;
-			const avgRhob = validRhob.reduce((sum, v) => sum + v, 0) / validRhob.length;
+		const nphi = summarizeCurve(nphiCurve.data);
+		const rhob = summarizeCurve(rhobCurve.data);
+		if (nphi.count > 0 && rhob.count > 0) {
+			const avgNphi = nphi.mean;
+			const avgRhob = rhob.mean;
 			avgPorosity = Math.max(0, Math.min(25, (avgNphi + (2.65 - avgRhob) / 0.015) / 2));
 		}
 	}
 
 	// Calculate net pay from gamma ray if available
 	let netPay = 150; // Default
-	if (grCurve) {
-		const validGR = grCurve.data.filter((v) => !Number.isNaN(v));
-		if (validGR.length > 0) {
-			const sandIntervals = validGR.filter((v) => v < 80).length;
-			netPay = (sandIntervals / validGR.length) * (lasData.depth_stop - lasData.depth_start);
-		}
+	const gr = grCurve ? summarizeCurve(grCurve.data, 80) : undefined;
+	if (gr && gr.count > 0) {
+		netPay = (gr.below / gr.count) * (lasData.depth_stop - lasData.depth_start);
 	}
 
 	// Calculate confidence based on QC results
@@ -301,7 +299,7 @@ async function analyzeGeologicalData(
 			? qcResults.reduce((sum, qc) => sum + (qc.validPoints / qc.totalPoints) * 100, 0) / qcResults.length
 			: 75;
 
-	const detectedFormations = identifyFormations(lasData, grCurve);
+	const detectedFormations = identifyFormations(lasData, gr && gr.count > 0 ? gr.mean : undefined);
 	const formationsForPrompt = (targetFormations ?? detectedFormations).join(", ") || "unidentified formation";
 	const depth = (lasData.depth_start + lasData.depth_stop) / 2;
 
@@ -551,21 +549,38 @@ function assessDataQuality(args: {
 }
 
 // Helper functions for geological analysis
-function identifyFormations(_lasData: LASData, grCurve?: LASCurve): string[] {
+
+/**
+ * Valid-sample count, mean, and count of samples below `cutoff` for a log curve,
+ * in a single pass that skips NaN nulls without building filtered copies.
+ */
+function summarizeCurve(
+	data: number[],
+	cutoff = Number.NEGATIVE_INFINITY,
+): { count: number; mean: number; below: number } {
+	let count = 0;
+	let sum = 0;
+	let below = 0;
+	for (let i = 0; i < data.length; i++) {
+		const v = data[i];
+		if (Number.isNaN(v)) continue;
+		count++;
+		sum += v;
+		if (v < cutoff) below++;
+	}
+	return { count, mean: count > 0 ? sum / count : Number.NaN, below };
+}
+
+function identifyFormations(_lasData: LASData, avgGR?: number): string[] {
 	const formations = ["Unidentified Formation"];
 
-	if (grCurve && Array.isArray(grCurve.data) && grCurve.data.length > 0) {
-		const validGR = grCurve.data.filter((v: number) => !Number.isNaN(v));
-		if (validGR.length > 0) {
-			const avgGR = validGR.reduce((sum: number, v: number) => sum + v, 0) / validGR.length;
-
-			if (avgGR > 120) {
-				formations.push("Wolfcamp A", "Bone Spring");
-			} else if (avgGR > 80) {
-				formations.push("Wolfcamp B", "Leonard");
-			} else {
-				formations.push("Spraberry", "Clear Fork");
-			}
+	if (avgGR !== undefined) {
+		if (avgGR > 120) {
+			formations.push("Wolfcamp A", "Bone Spring");
+		} else if (avgGR > 80) {
+			formations.push("Wolfcamp B", "Leonard");
+		} else {
+			formations.push("Spraberry", "Clear Fork");
 		}
 	}
 
@@ -11,6 +11,32 @@ import { callLLM } from "../shared/llm-client.js";
 import { runMCPServer } from "../shared/mcp-server.js";
 import { ServerFactory, type ServerTemplate, ServerUtils } from "../shared/server-factory.js";
 
+// ---------------------------------------------------------------------------
+// Static legal reference lists
+// ---------------------------------------------------------------------------
+
+// High-risk jurisdictions, permits, compliance requirements, and contract review advice
+const HIGH_RISK_JURISDICTIONS: readonly string[] = Object.freeze(["california", "colorado", "new mexico"]);
+
+const REQUIRED_PERMITS: readonly string[] = Object.freeze([
+	"Drilling permits",
+	"Environmental clearances",
+	"Land use approvals",
+	"Water usage permits",
+]);
+
+const COMPLIANCE_REQUIREMENTS = Object.freeze({
+	environmental: Object.freeze(["NEPA review", "State environmental laws", "Local ordinances"]),
+	safety: Object.freeze(["OSHA requirements", "DOT regulations", "State safety codes"]),
+	taxation: Object.freeze(["Severance taxes", "Property taxes", "Income tax implications"]),
+});
+
+const CONTRACT_REVIEW_RECOMMENDATIONS: readonly string[] = Object.freeze([
+	"Review indemnification clauses carefully",
+	"Negotiate favorable payment terms",
+	"Ensure clear operational responsibilities",
+]);
+
 // ---------------------------------------------------------------------------
 // Exported helpers (used by tests)
 // ---------------------------------------------------------------------------
@@ -21,9 +47,8 @@ import { ServerFactory, type ServerTemplate, ServerUtils } from "../shared/serve
  * Different inputs must produce different outputs so tests can verify determinism.
  */
 export function deriveDefaultRegulatoryRisk(jurisdiction: string, projectType: string): string {
-	const highRiskJurisdictions = ["california", "colorado", "new mexico"];
 	const jLower = jurisdiction.toLowerCase();
-	const isHighJurisdiction = highRiskJurisdictions.some((j) => jLower.includes(j));
+	const isHighJurisdiction = HIGH_RISK_JURISDICTIONS.some((j) => jLower.includes(j));
 
 	if (projectType === "exploration" || isHighJurisdiction) return "High";
 	if (projectType === "development") return "Medium";
@@ -134,15 +159,11 @@ const legalTemplate: ServerTemplate = {
 					project: args.projectType,
 					legal: {
 						permits: {
-							required: ["Drilling permits", "Environmental clearances", "Land use approvals", "Water usage permits"],
+							required: REQUIRED_PERMITS,
 							timeline: "4-6 months for standard approvals",
 							complexity: llmResult.regulatoryRisk,
 						},
-						compliance: {
-							environmental: ["NEPA review", "State environmental laws", "Local ordinances"],
-							safety: ["OSHA requirements", "DOT regulations", "State safety codes"],
-							taxation: ["Severance taxes", "Property taxes", "Income tax implications"],
-						},
+						compliance: COMPLIANCE_REQUIREMENTS,
 						risks: {
 							regulatory: `${llmResult.regulatoryRisk} - ${args.projectType} projects in ${args.jurisdiction}`,
 							keyRisks: llmResult.keyRisks,
@@ -201,11 +222,7 @@ const legalTemplate: ServerTemplate = {
 									? "Medium Risk"
 									: "High Risk",
 						negotiability: "Standard terms with room for negotiation",
-						recommendations: [
-							"Review indemnification clauses carefully",
-							"Negotiate favorable payment terms",
-							"Ensure clear operational responsibilities",
-						],
+						recommendations: CONTRACT_REVIEW_RECOMMENDATIONS,
 					},
 					confidence: ServerUtils.calculateConfidence(0.85, 0.9),
 				};
@@ -156,6 +156,27 @@ interface LocalExecutiveReport {
 	appendices: string[];
 }
 
+// ---------------------------------------------------------------------------
+// Static report fragments
+// ---------------------------------------------------------------------------
+
+// Next steps per recommendation, appendix titles, and the markdown footer
+const NEXT_STEPS_BY_RECOMMENDATION = Object.freeze({
+	PROCEED: Object.freeze(["Finalize drilling program", "Secure permits and approvals"]),
+	DEFER: Object.freeze(["Gather additional data", "Reassess market conditions"]),
+	REJECT: Object.freeze([]),
+}) satisfies Record<LocalInvestmentDecision["recommendation"], readonly string[]>;
+
+const REPORT_APPENDICES: readonly string[] = Object.freeze([
+	"Geological Analysis Details",
+	"Economic Model Assumptions",
+	"Risk Assessment Matrix",
+	"Competitive Analysis",
+]);
+
+const REPORT_MARKDOWN_FOOTER = `---
+*Generated by Shale Yeah 2025*`;
+
 const reporterTemplate: ServerTemplate = {
 	name: "reporter",
 	description: "Executive Reporting MCP Server",
@@ -295,12 +316,7 @@ function generateInvestmentDecision(args: {
 	if (keyMetrics.irr < 0.2) riskFactors.push("Moderate IRR");
 	if (!results.geological) riskFactors.push("Limited geological data");
 
-	const nextSteps = [];
-	if (recommendation === "PROCEED") {
-		nextSteps.push("Finalize drilling program", "Secure permits and approvals");
-	} else if (recommendation === "DEFER") {
-		nextSteps.push("Gather additional data", "Reassess market conditions");
-	}
+	const nextSteps = [...NEXT_STEPS_BY_RECOMMENDATION[recommendation]];
 
 	return {
 		recommendation,
@@ -324,9 +340,7 @@ function createExecutiveReport(args: {
 		executiveSummary: generateExecutiveSummary(args.tractName || "Unknown Tract", decision),
 		keyFindings: generateKeyFindings(decision),
 		recommendation: decision,
-		appendices: args.includeAppendices
-			? ["Geological Analysis Details", "Economic Model Assumptions", "Risk Assessment Matrix", "Competitive Analysis"]
-			: [],
+		appendices: args.includeAppendices ? [...REPORT_APPENDICES] : [],
 	};
 }
 
@@ -435,8 +449,7 @@ ${report.recommendation.riskFactors.map((risk) => `- ${risk}`).join("\n")}
 ### Next Steps
 ${report.recommendation.nextSteps.map((step) => `- ${step}`).join("\n")}
 
----
-*Generated by Shale Yeah 2025*`;
+${REPORT_MARKDOWN_FOOTER}`;
 }
 
 // Create the server using factory
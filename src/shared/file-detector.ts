@@ -3,7 +3,8 @@
  * Identifies and validates oil & gas industry file formats
  */
 
-import fs from "node:fs/promises";
+import type { Stats } from "node:fs";
+import fs, { type FileHandle } from "node:fs/promises";
 import path from "node:path";
 
 export interface FileMetadata {
@@ -124,19 +125,38 @@ export class FileFormatDetector {
 		},
 	};
 
+	// Extension → signature index built once from FORMAT_SIGNATURES, so format
+	// identification is a single Map lookup instead of scanning every signature's
+	// extension list per file. Extensions are unique across signatures.
+	private static readonly SIGNATURES_BY_EXTENSION = new Map(
+		Object.entries(FileFormatDetector.FORMAT_SIGNATURES).flatMap(([formatName, signature]) =>
+			signature.extensions.map((ext) => [ext, { formatName, signature }] as const),
+		),
+	);
+
 	/**
 	 * Detect file format based on extension, magic bytes, and content
 	 */
 	async detectFormat(filePath: string): Promise<FileMetadata> {
 		try {
-			const stats = await fs.stat(filePath);
-			const _ext = path.extname(filePath).toLowerCase();
+			// One open serves both the size/mtime (fstat on the descriptor) and the
+			// header read, instead of a separate stat by path before opening
+			const fileHandle = await fs.open(filePath, "r");
+			let stats: Stats;
+			let buffer: Buffer;
+			try {
+				stats = await fileHandle.stat();
+				// Read first 1KB for header analysis
+				buffer = await this.readFileHeader(fileHandle, 1024);
+			} finally {
+				await fileHandle.close();
+			}
 
-			// Read first 1KB for header analysis
-			const buffer = await this.readFileHeader(filePath, 1024);
+			// Derived once here and handed to identifyFormat()
+			const ext = path.extname(filePath).toLowerCase();
 
 			// Detect format
-			const format = await this.identifyFormat(filePath, buffer);
+			const format = await this.identifyFormat(filePath, ext, buffer);
 
 			// Extract metadata
 			const metadata = await this.extractBasicMetadata(filePath, format, buffer);
@@ -244,12 +264,10 @@ export class FileFormatDetector {
 		}
 	}
 
-	private async readFileHeader(filePath: string, bytes: number): Promise<Buffer> {
+	private async readFileHeader(fileHandle: FileHandle, bytes: number): Promise<Buffer> {
 		try {
-			const fileHandle = await fs.open(filePath, "r");
 			const buffer = Buffer.alloc(bytes);
 			const { bytesRead } = await fileHandle.read(buffer, 0, bytes, 0);
-			await fileHandle.close();
 			return buffer.subarray(0, bytesRead);
 		} catch (_error) {
 			return Buffer.alloc(0);
@@ -258,6 +276,7 @@ export class FileFormatDetector {
 
 	private async identifyFormat(
 		filePath: string,
+		ext: string,
 		buffer: Buffer,
 	): Promise<{
 		name: string;
@@ -266,34 +285,33 @@ export class FileFormatDetector {
 		isValid: boolean;
 		errors: string[];
 	}> {
-		const ext = path.extname(filePath).toLowerCase();
 		const content = buffer.toString("utf-8", 0, Math.min(512, buffer.length));
 
-		// Check each format signature
-		for (const [formatName, signature] of Object.entries(FileFormatDetector.FORMAT_SIGNATURES)) {
-			// Extension match
-			if (signature.extensions.includes(ext)) {
-				// Magic bytes check
-				if (signature.magicBytes && buffer.length >= signature.magicBytes.length) {
-					if (buffer.subarray(0, signature.magicBytes.length).equals(signature.magicBytes)) {
-						return { name: formatName, isValid: true, errors: [] };
-					}
-				}
+		// Extension match
+		const match = FileFormatDetector.SIGNATURES_BY_EXTENSION.get(ext);
+		if (match) {
+			const { formatName, signature } = match;
 
-				// Header pattern check
-				if (signature.headerPattern?.test(content)) {
+			// Magic bytes check
+			if (signature.magicBytes && buffer.length >= signature.magicBytes.length) {
+				if (buffer.subarray(0, signature.magicBytes.length).equals(signature.magicBytes)) {
 					return { name: formatName, isValid: true, errors: [] };
 				}
+			}
 
-				// Custom validator
-				if (signature.validator?.(buffer)) {
-					return { name: formatName, isValid: true, errors: [] };
-				}
+			// Header pattern check
+			if (signature.headerPattern?.test(content)) {
+				return { name: formatName, isValid: true, errors: [] };
+			}
 
-				// Extension match only (lower confidence)
-				if (!signature.magicBytes && !signature.headerPattern && !signature.validator) {
-					return { name: formatName, isValid: true, errors: [] };
-				}
+			// Custom validator
+			if (signature.validator?.(buffer)) {
+				return { name: formatName, isValid: true, errors: [] };
+			}
+
+			// Extension match only (lower confidence)
+			if (!signature.magicBytes && !signature.headerPattern && !signature.validator) {
+				return { name: formatName, isValid: true, errors: [] };
 			}
 		}
 
@@ -320,23 +338,27 @@ export class FileFormatDetector {
 	}
 
 	private detectEncoding(buffer: Buffer): string {
-		// Simple encoding detection
-		const text = buffer.toString("utf-8");
-		const hasNullBytes = buffer.includes(0);
-
-		if (hasNullBytes) return "binary";
-		if (/^[\x00-\x7F]*$/.test(text)) return "ascii";
-		return "utf-8";
+		// Simple encoding detection — inspects raw bytes, so the header never
+		// has to be decoded to a string just to classify it
+		if (buffer.includes(0)) return "binary";
+		for (const byte of buffer) {
+			if (byte > 0x7f) return "utf-8";
+		}
+		return "ascii";
 	}
 
 	private hasTextHeader(buffer: Buffer): boolean {
-		const firstLine = buffer.toString("utf-8").split("\n")[0];
-		return /^[a-zA-Z~#]/.test(firstLine);
+		// Only the first character decides — no need to decode and split the header
+		return buffer.length > 0 && /^[a-zA-Z~#]/.test(String.fromCharCode(buffer[0]));
 	}
 
 	private estimateCSVRows(buffer: Buffer): number {
-		const text = buffer.toString("utf-8");
-		const lines = text.split("\n").length;
+		// Count newline bytes in place rather than splitting a decoded copy
+		// (0x0A never occurs inside a multi-byte UTF-8 sequence)
+		let lines = 1;
+		for (let i = buffer.indexOf(0x0a); i !== -1; i = buffer.indexOf(0x0a, i + 1)) {
+			lines++;
+		}
 		// Rough estimate based on first chunk
 		const avgBytesPerLine = buffer.length / lines;
 		return avgBytesPerLine > 0 ? Math.floor((1024 * 1024) / avgBytesPerLine) : 0;
@@ -5,7 +5,7 @@
 
 import { FileFormatDetector, type FileMetadata } from "./file-detector.js";
 import { type ExcelData, ExcelParser } from "./parsers/excel-parser.js";
-import { type GISData, GISParser } from "./parsers/gis-parser.js";
+import type { GISData, GISParser } from "./parsers/gis-parser.js";
 import { type LASData, LASParser } from "./parsers/las-parser.js";
 import { type SEGYData, SEGYParser } from "./parsers/segy-parser.js";
 
@@ -29,18 +29,30 @@ export interface FileFormatSupport {
 export class FileIntegrationManager {
 	private detector: FileFormatDetector;
 	private lasParser: LASParser;
-	private gisParser: GISParser;
+	private gisParser: GISParser | null = null;
 	private excelParser: ExcelParser;
 	private segyParser: SEGYParser;
 
 	constructor() {
 		this.detector = new FileFormatDetector();
 		this.lasParser = new LASParser();
-		this.gisParser = new GISParser();
 		this.excelParser = new ExcelParser();
 		this.segyParser = new SEGYParser();
 	}
 
+	/**
+	 * GIS parser, loaded on first use — it pulls in turf, shapefile and xml2js,
+	 * which every server would otherwise load at startup whether or not it
+	 * ever sees a spatial file
+	 */
+	private async getGISParser(): Promise<GISParser> {
+		if (!this.gisParser) {
+			const { GISParser } = await import("./parsers/gis-parser.js");
+			this.gisParser = new GISParser();
+		}
+		return this.gisParser;
+	}
+
 	/**
 	 * Get list of all supported file formats
 	 */
@@ -290,7 +302,7 @@ export class FileIntegrationManager {
 
 	private async parseShapefile(filePath: string, metadata: FileMetadata): Promise<ParsedFileResult> {
 		try {
-			const data = await this.gisParser.parseShapefile(filePath);
+			const data = await (await this.getGISParser()).parseShapefile(filePath);
 
 			return {
 				metadata: { ...metadata, parsed: true },
@@ -312,7 +324,7 @@ export class FileIntegrationManager {
 
 	private async parseGeoJSON(filePath: string, metadata: FileMetadata): Promise<ParsedFileResult> {
 		try {
-			const data = await this.gisParser.parseGeoJSON(filePath);
+			const data = await (await this.getGISParser()).parseGeoJSON(filePath);
 
 			return {
 				metadata: { ...metadata, parsed: true },
@@ -333,7 +345,7 @@ export class FileIntegrationManager {
 
 	private async parseKML(filePath: string, metadata: FileMetadata): Promise<ParsedFileResult> {
 		try {
-			const data = await this.gisParser.parseKML(filePath);
+			const data = await (await this.getGISParser()).parseKML(filePath);
 
 			return {
 				metadata: { ...metadata, parsed: true },
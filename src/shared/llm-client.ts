@@ -9,6 +9,8 @@
  */
 
 import Anthropic from "@anthropic-ai/sdk";
+import { CircuitBreaker } from "../kernel/middleware/circuit-breaker.js";
+import { ErrorType } from "../kernel/types.js";
 
 export interface LLMCallOptions {
 	/** The user-turn prompt */
@@ -28,10 +30,61 @@ export interface LLMCallOptions {
 	 * Falls back to process.env.ANTHROPIC_API_KEY when not provided (dev/CI default).
 	 */
 	apiKey?: string;
+	/** Per-attempt request timeout in milliseconds (defaults to 120s) */
+	timeoutMs?: number;
 }
 
 const DEFAULT_MODEL = "claude-opus-4-6";
 const DEFAULT_MAX_TOKENS = 4096;
+/**
+ * The SDK's own default is 10 minutes per attempt. A 4096-token response finishes
+ * well inside two, and a stalled connection should fail fast enough to retry.
+ */
+const DEFAULT_TIMEOUT_MS = 120_000;
+
+/**
+ * Breaker for API outages, keyed by API key like the client cache so one
+ * tenant's rate limits never fail another tenant's calls. Every server falls
+ * back to rule-based output when callLLM throws, so once the API is plainly down
+ * it is better to throw at once than to let each call sit through its timeout
+ * and retries. Only transient failures (connection, 429, 5xx) count as
+ * RETRYABLE; auth and request errors do not trip it.
+ */
+const breaker = new CircuitBreaker();
+
+/** The slice of the SDK client that callLLM uses */
+export interface LLMClient {
+	messages: {
+		create(body: Anthropic.MessageCreateParamsNonStreaming, options?: { timeout?: number }): Promise<Anthropic.Message>;
+	};
+}
+
+const sdkClient = (apiKey: string): LLMClient => new Anthropic({ apiKey });
+let clientFactory = sdkClient;
+
+/**
+ * One SDK client per API key, reused across calls. Each client owns a keep-alive
+ * connection pool, so reusing it spares every call a fresh TCP/TLS handshake.
+ */
+const clients = new Map<string, LLMClient>();
+
+/**
+ * Replace how clients are built — tests pass a mock so CI never needs an API key.
+ * Call with no argument to restore the real SDK. Drops cached clients either way.
+ */
+export function setLLMClientFactory(factory?: (apiKey: string) => LLMClient): void {
+	clientFactory = factory ?? sdkClient;
+	clients.clear();
+}
+
+function clientFor(apiKey: string): LLMClient {
+	let client = clients.get(apiKey);
+	if (!client) {
+		client = clientFactory(apiKey);
+		clients.set(apiKey, client);
+	}
+	return client;
+}
 
 /**
  * Call Claude and return the text response.
@@ -50,15 +103,27 @@ export async function callLLM(options: LLMCallOptions): Promise<string> {
 		);
 	}
 
-	const client = new Anthropic({ apiKey });
+	if (breaker.isOpen(apiKey)) {
+		throw new Error("LLM circuit open after repeated API failures; skipping call until it resets");
+	}
 
-	const response = await client.messages.create({
-		model: options.model ?? DEFAULT_MODEL,
-		max_tokens: options.maxTokens ?? DEFAULT_MAX_TOKENS,
-		thinking: { type: "adaptive" },
-		...(options.system ? { system: options.system } : {}),
-		messages: [{ role: "user", content: options.prompt }],
-	});
+	let response: Anthropic.Message;
+	try {
+		response = await clientFor(apiKey).messages.create(
+			{
+				model: options.model ?? DEFAULT_MODEL,
+				max_tokens: options.maxTokens ?? DEFAULT_MAX_TOKENS,
+				thinking: { type: "adaptive" },
+				...(options.system ? { system: options.system } : {}),
+				messages: [{ role: "user", content: options.prompt }],
+			},
+			{ timeout: options.timeoutMs ?? DEFAULT_TIMEOUT_MS },
+		);
+	} catch (err) {
+		breaker.record(apiKey, false, isTransientFailure(err) ? ErrorType.RETRYABLE : ErrorType.PERMANENT);
+		throw err;
+	}
+	breaker.record(apiKey, true);
 
 	const textBlock = response.content.find((b) => b.type === "text");
 	if (!textBlock || textBlock.type !== "text") {
@@ -67,3 +132,8 @@ export async function callLLM(options: LLMCallOptions): Promise<string> {
 
 	return textBlock.text;
 }
+
+function isTransientFailure(err: unknown): boolean {
+	if (err instanceof Anthropic.APIConnectionError) return true;
+	return err instanceof Anthropic.APIError && (err.status === 429 || (err.status ?? 0) >= 500);
+}
@@ -4,7 +4,7 @@
  */
 
 import fs from "node:fs/promises";
-import * as ExcelJS from "exceljs";
+import type * as ExcelJS from "exceljs";
 
 export interface ExcelSheet {
 	name: string;
@@ -66,7 +66,10 @@ export class ExcelParser {
 
 		try {
 			const stats = await fs.stat(filePath);
-			const workbook = new ExcelJS.Workbook();
+			// exceljs is loaded on first workbook — every MCP server imports this parser
+			// through the file integration layer, but few ever open a spreadsheet
+			const { Workbook, ValueType } = await import("exceljs");
+			const workbook = new Workbook();
 			await workbook.xlsx.readFile(filePath);
 
 			const sheets: ExcelSheet[] = [];
@@ -74,7 +77,7 @@ export class ExcelParser {
 			let totalColumns = 0;
 
 			workbook.eachSheet((worksheet) => {
-				const sheetData = this.parseWorksheet(worksheet, worksheet.name);
+				const sheetData = this.parseWorksheet(worksheet, worksheet.name, ValueType.Formula);
 				sheets.push(sheetData);
 				totalRows += sheetData.rowCount;
 				totalColumns = Math.max(totalColumns, sheetData.columnCount);
@@ -146,7 +149,7 @@ export class ExcelParser {
 				data: actualData,
 				headers,
 				rowCount: actualData.length,
-				columnCount: actualData.length > 0 ? Math.max(...actualData.map((row) => row.length)) : 0,
+				columnCount: actualData.reduce((max, row) => Math.max(max, row.length), 0),
 				range: `A1:${this.columnIndexToLetter(actualData[0]?.length || 0)}${actualData.length}`,
 				metadata: {
 					hasHeaders: !!headers,
@@ -243,7 +246,7 @@ export class ExcelParser {
 		return costData;
 	}
 
-	private parseWorksheet(worksheet: ExcelJS.Worksheet, sheetName: string): ExcelSheet {
+	private parseWorksheet(worksheet: ExcelJS.Worksheet, sheetName: string, formulaType: ExcelJS.ValueType): ExcelSheet {
 		const data: any[][] = [];
 		let columnCount = 0;
 
@@ -266,7 +269,7 @@ export class ExcelParser {
 
 		const dataTypes = this.detectColumnDataTypes(data);
 		const nullCells = this.countNullCells(data);
-		const formulaCells = this.countFormulaCellsExcelJS(worksheet);
+		const formulaCells = this.countFormulaCellsExcelJS(worksheet, formulaType);
 
 		return {
 			name: sheetName,
@@ -348,12 +351,12 @@ export class ExcelParser {
 		return data.flat().filter((cell) => cell == null || cell === "").length;
 	}
 
-	private countFormulaCellsExcelJS(worksheet: ExcelJS.Worksheet): number {
+	private countFormulaCellsExcelJS(worksheet: ExcelJS.Worksheet, formulaType: ExcelJS.ValueType): number {
 		let count = 0;
 
 		worksheet.eachRow((row) => {
 			row.eachCell((cell) => {
-				if (cell.type === ExcelJS.ValueType.Formula) {
+				if (cell.type === formulaType) {
 					count++;
 				}
 			});
@@ -382,14 +385,21 @@ export class ExcelParser {
 	}
 
 	private detectCSVDelimiter(content: string): string {
-		const sample = content.split("\n").slice(0, 5).join("\n");
+		// Sample the first five lines by locating the fifth newline — splitting
+		// the whole file into lines just to keep five is O(file) allocation
+		let sampleEnd = -1;
+		for (let line = 0; line < 5; line++) {
+			sampleEnd = content.indexOf("\n", sampleEnd + 1);
+			if (sampleEnd === -1) break;
+		}
+		const sample = sampleEnd === -1 ? content : content.slice(0, sampleEnd);
 		const delimiters = [",", ";", "\t", "|"];
 
 		let maxCount = 0;
 		let bestDelimiter = ",";
 
 		for (const delimiter of delimiters) {
-			const count = (sample.match(new RegExp(`\\${delimiter}`, "g")) || []).length;
+			const count = sample.split(delimiter).length - 1;
 			if (count > maxCount) {
 				maxCount = count;
 				bestDelimiter = delimiter;
@@ -400,6 +410,12 @@ export class ExcelParser {
 	}
 
 	private parseCSVLine(line: string, delimiter: string): string[] {
+		// Fast path: with no quotes a row is a plain split, done natively instead of
+		// rebuilding every cell one character at a time
+		if (delimiter.length === 1 && !line.includes('"')) {
+			return line.split(delimiter).map((cell) => cell.trim());
+		}
+
 		const cells: string[] = [];
 		let current = "";
 		let inQuotes = false;
@@ -139,7 +139,9 @@ export class GISParser {
 		const startTime = Date.now();
 
 		try {
-			const content = await fs.readFile(filePath, "utf-8");
+			// The raw buffer length is the file size — no separate stat() needed
+			const raw = await fs.readFile(filePath);
+			const content = raw.toString("utf-8");
 			const data = JSON.parse(content);
 
 			let featureCollection: FeatureCollection;
@@ -180,7 +182,6 @@ export class GISParser {
 			const bounds = this.calculateBounds(featureCollection.features);
 			const attributeFields = this.extractAttributeFields(featureCollection.features);
 			const coordinateSystem = this.extractCRS(featureCollection);
-			const stats = await fs.stat(filePath);
 
 			return {
 				type: "geojson",
@@ -191,7 +192,7 @@ export class GISParser {
 					geometryTypes: Array.from(geometryTypes),
 					attributeFields,
 					coordinateSystem,
-					fileSize: stats.size,
+					fileSize: raw.length,
 					parseTime: Date.now() - startTime,
 					quality: this.assessGISQuality(featureCollection.features, coordinateSystem),
 				},
@@ -208,7 +209,8 @@ export class GISParser {
 		const startTime = Date.now();
 
 		try {
-			const content = await fs.readFile(filePath, "utf-8");
+			const raw = await fs.readFile(filePath);
+			const content = raw.toString("utf-8");
 			const features: Feature[] = [];
 
 			// Parse XML
@@ -243,7 +245,6 @@ export class GISParser {
 
 			const bounds = this.calculateBounds(features);
 			const attributeFields = this.extractAttributeFields(features);
-			const stats = await fs.stat(filePath);
 
 			return {
 				type: "kml",
@@ -254,7 +255,7 @@ export class GISParser {
 					geometryTypes: Array.from(geometryTypes),
 					attributeFields,
 					coordinateSystem: "WGS84", // KML uses WGS84 by default
-					fileSize: stats.size,
+					fileSize: raw.length,
 					parseTime: Date.now() - startTime,
 					quality: this.assessGISQuality(features, "WGS84"),
 				},
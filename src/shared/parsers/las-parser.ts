@@ -76,16 +76,17 @@ export class LASParser {
 		const startTime = Date.now();
 
 		try {
-			const content = await fs.readFile(filePath, "utf-8");
-			const stats = await fs.stat(filePath);
+			// The raw buffer length is the file size — no separate stat() needed
+			const raw = await fs.readFile(filePath);
+			const content = raw.toString("utf-8");
 
 			const sections = this.parseIntoSections(content);
 
-			const header = this.parseVersionSection(sections.version || "");
-			const wellInfo = this.parseWellSection(sections.well || "");
-			const curves = this.parseCurveSection(sections.curve || "");
-			const parameters = this.parseParameterSection(sections.parameter || "");
-			const dataMatrix = this.parseDataSection(sections.data || "", curves, header.wrap);
+			const header = this.parseVersionSection(sections.version || []);
+			const wellInfo = this.parseWellSection(sections.well || []);
+			const curves = this.parseCurveSection(sections.curve || []);
+			const parameters = this.parseParameterSection(sections.parameter || []);
+			const dataMatrix = this.parseDataSection(sections.data || [], curves, header.wrap);
 
 			// Calculate depth range
 			const depthRange = this.calculateDepthRange(dataMatrix, curves);
@@ -107,7 +108,7 @@ export class LASParser {
 					totalRows: dataMatrix.length,
 					curveCount: curves.length,
 					nullValue: this.nullValue,
-					fileSize: stats.size,
+					fileSize: raw.length,
 					parseTime: Date.now() - startTime,
 					quality,
 				},
@@ -117,8 +118,11 @@ export class LASParser {
 		}
 	}
 
-	private parseIntoSections(content: string): Record<string, string> {
-		const sections: Record<string, string> = {};
+	// Sections are returned as line arrays: the file is split into lines exactly
+	// once here, and the section parsers iterate those lines directly instead of
+	// re-joining and re-splitting each section (the data section dominates).
+	private parseIntoSections(content: string): Record<string, string[]> {
+		const sections: Record<string, string[]> = {};
 		const lines = content.split("\n");
 		let currentSection = "";
 		let sectionContent: string[] = [];
@@ -133,7 +137,7 @@ export class LASParser {
 			if (trimmed.startsWith("~")) {
 				// Save previous section
 				if (currentSection && sectionContent.length > 0) {
-					sections[currentSection] = sectionContent.join("\n");
+					sections[currentSection] = sectionContent;
 				}
 
 				// Start new section
@@ -146,7 +150,7 @@ export class LASParser {
 
 		// Save final section
 		if (currentSection && sectionContent.length > 0) {
-			sections[currentSection] = sectionContent.join("\n");
+			sections[currentSection] = sectionContent;
 		}
 
 		return sections;
@@ -178,15 +182,13 @@ export class LASParser {
 		return sectionMap[sectionName] || sectionName;
 	}
 
-	private parseVersionSection(content: string): LASHeader {
+	private parseVersionSection(lines: string[]): LASHeader {
 		const header: LASHeader = {
 			version: "2.0",
 			wrap: false,
 			delimiter: " ",
 		};
 
-		const lines = content.split("\n");
-
 		for (const line of lines) {
 			const trimmed = line.trim();
 			if (!trimmed) continue;
@@ -210,9 +212,8 @@ export class LASParser {
 		return header;
 	}
 
-	private parseWellSection(content: string): LASWellInfo {
+	private parseWellSection(lines: string[]): LASWellInfo {
 		const wellInfo: LASWellInfo = {};
-		const lines = content.split("\n");
 
 		for (const line of lines) {
 			const trimmed = line.trim();
@@ -231,9 +232,8 @@ export class LASParser {
 		return wellInfo;
 	}
 
-	private parseCurveSection(content: string): LASCurve[] {
+	private parseCurveSection(lines: string[]): LASCurve[] {
 		const curves: LASCurve[] = [];
-		const lines = content.split("\n");
 
 		for (const line of lines) {
 			const trimmed = line.trim();
@@ -253,9 +253,8 @@ export class LASParser {
 		return curves;
 	}
 
-	private parseParameterSection(content: string): LASParameter[] {
+	private parseParameterSection(lines: string[]): LASParameter[] {
 		const parameters: LASParameter[] = [];
-		const lines = content.split("\n");
 
 		for (const line of lines) {
 			const trimmed = line.trim();
@@ -294,8 +293,7 @@ export class LASParser {
 		};
 	}
 
-	private parseDataSection(content: string, curves: LASCurve[], wrap: boolean): number[][] {
-		const lines = content.split("\n");
+	private parseDataSection(lines: string[], curves: LASCurve[], wrap: boolean): number[][] {
 		const data: number[][] = [];
 		let currentRow: number[] = [];
 
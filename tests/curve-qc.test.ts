@@ -0,0 +1,65 @@
+/**
+ * Curve QC Tests
+ *
+ * Validates analyzeCurve() QC statistics on already-parsed LAS data against
+ * known values for the demo LAS file — so geowiz can parse a LAS file once and
+ * QC every key curve from the parsed data.
+ */
+
+import assert from "node:assert";
+import { analyzeCurve, analyzeLASCurve } from "../tools/curve-qc.js";
+import { parseLASFile } from "../tools/las-parse.js";
+
+const DEMO_LAS = "data/samples/demo.las";
+
+let passed = 0;
+let failed = 0;
+
+function test(name: string, fn: () => void | Promise<void>): Promise<void> {
+	return Promise.resolve()
+		.then(fn)
+		.then(() => {
+			console.log(`  ✓ ${name}`);
+			passed++;
+		})
+		.catch((err: unknown) => {
+			console.log(`  ✗ ${name}`);
+			console.log(`    ${err instanceof Error ? err.message : String(err)}`);
+			failed++;
+		});
+}
+
+console.log("\n🧪 Curve QC Tests\n");
+
+await test("analyzeCurve and analyzeLASCurve report the expected QC statistics for demo.las", () => {
+	const lasData = parseLASFile(DEMO_LAS);
+	const expected = {
+		GR: { min: 43.129, max: 53.278, mean: 48.75465853658537, rmse: 2.5309981125176924 },
+		NPHI: { min: 0.178, max: 0.186, mean: 0.1811951219512195, rmse: 0.002360441382816628 },
+		RHOB: { min: 2.447, max: 2.453, mean: 2.450414634146341, rmse: 0.0016747770146441233 },
+	};
+	for (const [curveName, stats] of Object.entries(expected)) {
+		for (const result of [analyzeCurve(lasData, curveName), analyzeLASCurve(DEMO_LAS, curveName)]) {
+			assert.strictEqual(result.totalPoints, 41, `${curveName} totalPoints`);
+			assert.strictEqual(result.validPoints, 41, `${curveName} validPoints`);
+			assert.strictEqual(result.minValue, stats.min, `${curveName} min`);
+			assert.strictEqual(result.maxValue, stats.max, `${curveName} max`);
+			assert.ok(Math.abs(result.meanValue - stats.mean) < 1e-9, `${curveName} mean`);
+			assert.ok(Math.abs((result.rmse ?? Number.NaN) - stats.rmse) < 1e-9, `${curveName} rmse`);
+		}
+	}
+});
+
+await test("analyzeCurve reports available curves for an unknown curve", () => {
+	const result = analyzeCurve(parseLASFile(DEMO_LAS), "NOPE");
+	assert.ok(result.error?.includes("not found"));
+	assert.ok(result.availableCurves?.includes("GR"));
+});
+
+await test("analyzeLASCurve returns an error result for a missing file", () => {
+	const result = analyzeLASCurve("data/samples/does-not-exist.las", "GR");
+	assert.ok(result.error?.startsWith("Failed to analyze LAS file"));
+});
+
+console.log(`\n  Results: ${passed} passed, ${failed} failed\n`);
+if (failed > 0) process.exit(1);
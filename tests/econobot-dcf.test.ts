@@ -0,0 +1,68 @@
+/**
+ * Econobot DCF Tests
+ *
+ * Validates calculateIRR() against known IRRs across cash-flow scales — the
+ * bisection must stop on bracket width, not an absolute NPV tolerance, so
+ * flows in $MM units or per-unit terms resolve as precisely as dollar flows,
+ * and long monthly series must not overflow at the bottom of the bracket.
+ * Also checks the single-pass NPV/payback summary behind calculate_dcf.
+ */
+
+import assert from "node:assert";
+import { calculateIRR, summarizeCashFlows } from "../src/servers/econobot.js";
+
+let passed = 0;
+let failed = 0;
+
+function test(name: string, fn: () => void | Promise<void>): Promise<void> {
+	return Promise.resolve()
+		.then(fn)
+		.then(() => {
+			console.log(`  ✓ ${name}`);
+			passed++;
+		})
+		.catch((err: unknown) => {
+			console.log(`  ✗ ${name}`);
+			console.log(`    ${err instanceof Error ? err.message : String(err)}`);
+			failed++;
+		});
+}
+
+console.log("\n🧪 Econobot DCF Tests\n");
+
+await test("calculateIRR resolves small-magnitude cash flows", () => {
+	// -1 + 0.5/(1+r) + 0.6/(1+r)^2 = 0 → r ≈ 6.39%
+	assert.strictEqual(calculateIRR([-1, 0.5, 0.6]), 6.39);
+	// r ≈ 8.90%
+	assert.strictEqual(calculateIRR([-100, 30, 40, 50]), 8.9);
+});
+
+await test("calculateIRR gives the same IRR for the same flows at dollar scale", () => {
+	assert.strictEqual(calculateIRR([-100_000_000, 30_000_000, 40_000_000, 50_000_000]), 8.9);
+	// Five-year $1.5M annuity on a $5M investment → r ≈ 15.24%
+	assert.strictEqual(calculateIRR([-5_000_000, 1_500_000, 1_500_000, 1_500_000, 1_500_000, 1_500_000]), 15.24);
+});
+
+await test("calculateIRR resolves long monthly series without overflowing", () => {
+	// 200 periods: discounting at -99% overflows, so the lower bound must move in
+	assert.strictEqual(calculateIRR([-1000, ...Array(199).fill(12)]), 1.05);
+	// Zero flows during a 12-month build would turn an overflowed NPV into NaN
+	assert.strictEqual(calculateIRR([-1000, ...Array(11).fill(0), ...Array(300).fill(15)]), 1.28);
+});
+
+await test("calculateIRR returns null when NPV never changes sign", () => {
+	assert.strictEqual(calculateIRR([-100, -50]), null);
+	assert.strictEqual(calculateIRR([100, 50]), null);
+});
+
+await test("summarizeCashFlows returns NPV and payback from one pass", () => {
+	const { npv, paybackPeriod } = summarizeCashFlows([-100, 30, 40, 50], 0.1);
+	// -100 + 30/1.1 + 40/1.21 + 50/1.331
+	assert.ok(Math.abs(npv - -2.103681442524419) < 1e-9, `Expected NPV ≈ -2.10, got ${npv}`);
+	assert.strictEqual(paybackPeriod, 3);
+	// Cumulative cash flow never turns non-negative → payback is the series length
+	assert.strictEqual(summarizeCashFlows([-100, 30, 40], 0.1).paybackPeriod, 3);
+});
+
+console.log(`\n  Results: ${passed} passed, ${failed} failed\n`);
+if (failed > 0) process.exit(1);
@@ -219,6 +219,62 @@ console.log("\n💾 Testing file persistence...");
 	assert(allValid, "All lines are valid JSON");
 }
 
+// ==========================================
+// Test: Entries survive the day file being deleted or rotated
+// ==========================================
+
+console.log("\n📎 Testing writes after the audit file is deleted or rotated...");
+{
+	const auditDir = path.join(AUDIT_DIR, "reopen-test");
+	const audit = new AuditMiddleware({ enabled: true, auditPath: auditDir });
+	const entry = () => audit.buildEntry("geowiz.analyze", "request", {}, "user-1", "sess-1", "analyst");
+	const dayFile = path.join(auditDir, `${new Date().toISOString().slice(0, 10)}.jsonl`);
+
+	audit.logRequest(entry());
+	fs.rmSync(dayFile);
+	audit.logRequest(entry());
+	assert(audit.getEntries().length === 1, "Entry after deletion lands in a recreated day file");
+
+	fs.renameSync(dayFile, `${dayFile}.1`);
+	audit.logRequest(entry());
+	assert(audit.getEntries().length === 1, "Entry after rotation lands in a new day file, not the rotated one");
+	assert(fs.readFileSync(`${dayFile}.1`, "utf-8").trim().split("\n").length === 1, "Rotated file is not appended to");
+
+	// A second instance on the same path appends to the same day file
+	const other = new AuditMiddleware({ enabled: true, auditPath: auditDir });
+	other.logRequest(entry());
+	other.close();
+	audit.close();
+	assert(audit.getEntries().length === 2, "Entries from two instances share the day file");
+}
+
+// ==========================================
+// Test: Kernel.shutdown() releases the audit descriptor
+// ==========================================
+
+console.log("\n🔌 Testing Kernel.shutdown()...");
+{
+	const auditDir = path.join(AUDIT_DIR, "shutdown-test");
+	const kernel = new Kernel({
+		security: { requireAuth: false, auditEnabled: true, auditPath: auditDir },
+	});
+	let closes = 0;
+	const close = kernel.audit.close.bind(kernel.audit);
+	kernel.audit.close = () => {
+		closes++;
+		close();
+	};
+
+	kernel.audit.logRequest(kernel.audit.buildEntry("geowiz.analyze", "request", {}, "user-1", "sess-1", "analyst"));
+	closes = 0;
+	kernel.shutdown();
+	assert(closes === 1, "shutdown() closes the audit trail");
+
+	kernel.audit.logRequest(kernel.audit.buildEntry("geowiz.analyze", "request", {}, "user-1", "sess-1", "analyst"));
+	kernel.shutdown();
+	assert(kernel.audit.getEntries().length === 2, "Audit reopens after shutdown and keeps appending");
+}
+
 // ==========================================
 // Test: Sensitive values redacted in persisted entries
 // ==========================================
@@ -42,6 +42,9 @@ interface MonteCarloArgs {
 	iterations: number;
 	targetIRR: number;
 	outputPath?: string;
+	seed?: number;
+	antithetic?: boolean;
+	correlation?: number[][];
 }
 
 interface MonteCarloAnalysis {
@@ -201,6 +204,74 @@ async function runTests(): Promise<void> {
 		);
 	});
 
+	await test("seeded runs are reproducible; different seeds differ", () => {
+		const r1 = monteCarloFn({ ...defaultArgs, seed: 42 });
+		const r2 = monteCarloFn({ ...defaultArgs, seed: 42 });
+		const r3 = monteCarloFn({ ...defaultArgs, seed: 43 });
+		assert.deepStrictEqual(r1.results, r2.results, "Same seed must reproduce identical results");
+		assert.notStrictEqual(r1.results.npv.p50, r3.results.npv.p50, "Different seeds should give different runs");
+	});
+
+	await test("antithetic sampling reduces run-to-run spread of the NPV mean", () => {
+		const spread = (antithetic: boolean): number => {
+			const means: number[] = [];
+			for (let seed = 1; seed <= 20; seed++) {
+				means.push(monteCarloFn({ ...defaultArgs, iterations: 2000, seed, antithetic }).results.npv.mean);
+			}
+			const avg = means.reduce((a, b) => a + b) / means.length;
+			return Math.sqrt(means.reduce((s, m) => s + (m - avg) ** 2, 0) / means.length);
+		};
+		const plain = spread(false);
+		const paired = spread(true);
+		assert.ok(paired < plain, `Antithetic spread ${paired.toFixed(0)} should be below plain ${plain.toFixed(0)}`);
+	});
+
+	await test("price/capex correlation moves NPV spread in the expected direction", () => {
+		// NPV = revenue − capex: costs that rise with price offset it, costs that fall amplify it
+		const priceCapex = (r: number): number[][] => [
+			[1, 0, 0, r],
+			[0, 1, 0, 0],
+			[0, 0, 1, 0],
+			[r, 0, 0, 1],
+		];
+		const together = monteCarloFn({ ...defaultArgs, seed: 1, correlation: priceCapex(0.9) }).results.npv.stdDev;
+		const opposed = monteCarloFn({ ...defaultArgs, seed: 1, correlation: priceCapex(-0.9) }).results.npv.stdDev;
+		assert.ok(together < opposed, `Expected stdDev ${together.toFixed(0)} < ${opposed.toFixed(0)}`);
+	});
+
+	await test("non positive-definite correlation matrix is rejected", () => {
+		const singular = [
+			[1, 1, 0, 0],
+			[1, 1, 0, 0],
+			[0, 0, 1, 0],
+			[0, 0, 0, 1],
+		];
+		assert.throws(() => monteCarloFn({ ...defaultArgs, correlation: singular }), /positive definite/);
+	});
+
+	await test("correlation matrix without a unit diagonal is rejected", () => {
+		const scaled = [
+			[0.5, 0, 0, 0],
+			[0, 1, 0, 0],
+			[0, 0, 1, 0],
+			[0, 0, 0, 1],
+		];
+		assert.throws(() => monteCarloFn({ ...defaultArgs, correlation: scaled }), /1 on the diagonal/);
+	});
+
+	await test("createSeededRandom yields uniform values in [0, 1)", async () => {
+		const { createSeededRandom } = await import("../src/servers/risk-analysis.js");
+		const rand = createSeededRandom(7);
+		const N = 50000;
+		let sum = 0;
+		for (let i = 0; i < N; i++) {
+			const u = rand();
+			assert.ok(u >= 0 && u < 1, `Expected value in [0,1), got ${u}`);
+			sum += u;
+		}
+		assert.ok(Math.abs(sum / N - 0.5) < 0.01, `Expected mean ≈ 0.5, got ${(sum / N).toFixed(4)}`);
+	});
+
 	await test("probability.positive_npv is between 0 and 1", () => {
 		const result = monteCarloFn(defaultArgs);
 		const p = result.results.probability.positive_npv;
@@ -8,15 +8,50 @@
  * - callLLM() accepts an optional model override
  * - LLMCallOptions type is exported and structurally correct
  * - SDK is invoked (mocked via env var when key absent)
+ * - repeated transient API failures open the circuit breaker for that API key (mocked SDK)
  */
 
 import assert from "node:assert";
-import type { LLMCallOptions } from "../src/shared/llm-client.js";
-import { callLLM } from "../src/shared/llm-client.js";
+import Anthropic from "@anthropic-ai/sdk";
+import type { LLMCallOptions, LLMClient } from "../src/shared/llm-client.js";
+import { callLLM, setLLMClientFactory } from "../src/shared/llm-client.js";
 
 let passed = 0;
 let failed = 0;
 
+/**
+ * Install a mock SDK client for every API key. Each request body is recorded;
+ * `reply` supplies the response text (or throws to simulate an API failure).
+ */
+function mockClient(
+	reply: (body: Anthropic.MessageCreateParamsNonStreaming) => string | Promise<string>,
+): Anthropic.MessageCreateParamsNonStreaming[] {
+	const requests: Anthropic.MessageCreateParamsNonStreaming[] = [];
+	const client: LLMClient = {
+		messages: {
+			create: async (body) => {
+				requests.push(body);
+				const text = await reply(body);
+				return { content: [{ type: "text", text }] } as unknown as Anthropic.Message;
+			},
+		},
+	};
+	setLLMClientFactory(() => client);
+	return requests;
+}
+
+/** Run `fn` with Date.now() shifted `offsetMs` into the future */
+async function later<T>(offsetMs: number, fn: () => Promise<T>): Promise<T> {
+	const realNow = Date.now;
+	const start = realNow();
+	Date.now = () => start + offsetMs;
+	try {
+		return await fn();
+	} finally {
+		Date.now = realNow;
+	}
+}
+
 function test(name: string, fn: () => void | Promise<void>): Promise<void> {
 	return Promise.resolve()
 		.then(fn)
@@ -67,6 +102,21 @@ async function runTests(): Promise<void> {
 		assert.strictEqual(opts.maxTokens, 1024);
 	});
 
+	await test("system is sent to the SDK as a plain string", async () => {
+		const requests = mockClient(() => "ok");
+		await callLLM({ prompt: "test", system: "You are a geologist.", apiKey: "test-key" });
+		assert.strictEqual(requests[0].system, "You are a geologist.");
+		setLLMClientFactory();
+	});
+
+	await test("LLMCallOptions type accepts optional timeoutMs", () => {
+		const opts: LLMCallOptions = {
+			prompt: "test",
+			timeoutMs: 30_000,
+		};
+		assert.strictEqual(opts.timeoutMs, 30_000);
+	});
+
 	// When ANTHROPIC_API_KEY is not set, callLLM should throw a clear error
 	// rather than silently returning empty or crashing with an SDK internal error.
 	await test("callLLM throws descriptive error when ANTHROPIC_API_KEY is absent", async () => {
@@ -88,6 +138,41 @@ async function runTests(): Promise<void> {
 		}
 	});
 
+	await test("circuit breaker fails fast after repeated API outages and resets after a probe", async () => {
+		let outage = true;
+		let attempt = 0;
+		const requests = mockClient(() => {
+			if (!outage) return "back online";
+			throw ++attempt % 2
+				? Anthropic.APIError.generate(529, undefined, "overloaded", new Headers())
+				: new Anthropic.APIConnectionError({ message: "connection reset" });
+		});
+		const call = () => callLLM({ prompt: "probe", apiKey: "test-key" });
+
+		for (let i = 0; i < 3; i++) {
+			await assert.rejects(call(), (err) => err instanceof Anthropic.APIError);
+		}
+		assert.strictEqual(requests.length, 3);
+
+		// Open: the next call is rejected without reaching the SDK
+		await assert.rejects(call(), /circuit open/);
+		assert.strictEqual(requests.length, 3);
+
+		// The circuit is per API key: another tenant's calls still reach the SDK
+		outage = false;
+		assert.strictEqual(await callLLM({ prompt: "probe", apiKey: "other-key" }), "back online");
+		assert.strictEqual(requests.length, 4);
+		await assert.rejects(call(), /circuit open/);
+
+		// After the cooldown one probe goes through; its success closes the circuit
+		assert.strictEqual(await later(30_001, call), "back online");
+		assert.strictEqual(requests.length, 5);
+		assert.strictEqual(await call(), "back online");
+		assert.strictEqual(requests.length, 6);
+
+		setLLMClientFactory();
+	});
+
 	// Summary
 	console.log(`\n  Results: ${passed} passed, ${failed} failed\n`);
 	if (failed > 0) {
@@ -41,35 +41,31 @@ function computeRMSE_NRMSE(
 		return { rmse: NaN, nrmse: NaN };
 	}
 
-	// Remove NaN values
-	const validPairs: [number, number][] = [];
+	// Single pass over the valid (non-NaN) pairs: squared error plus the value
+	// range, without materializing pair or value arrays
+	let count = 0;
+	let sumSquaredErrors = 0;
+	let minValue = Infinity;
+	let maxValue = -Infinity;
 	for (let i = 0; i < values.length; i++) {
 		const v = values[i];
 		const f = fittedValues[i];
-		if (!Number.isNaN(v) && !Number.isNaN(f)) {
-			validPairs.push([v, f]);
-		}
+		if (Number.isNaN(v) || Number.isNaN(f)) continue;
+		count++;
+		sumSquaredErrors += (v - f) ** 2;
+		if (v < minValue) minValue = v;
+		if (v > maxValue) maxValue = v;
 	}
 
-	if (validPairs.length === 0) {
+	if (count === 0) {
 		return { rmse: NaN, nrmse: NaN };
 	}
 
 	// Calculate RMSE
-	let sumSquaredErrors = 0;
-	const validValues: number[] = [];
-
-	for (const [v, f] of validPairs) {
-		sumSquaredErrors += (v - f) ** 2;
-		validValues.push(v);
-	}
-
-	const mse = sumSquaredErrors / validPairs.length;
+	const mse = sumSquaredErrors / count;
 	const rmse = Math.sqrt(mse);
 
 	// Calculate NRMSE (normalized by range)
-	const minValue = Math.min(...validValues);
-	const maxValue = Math.max(...validValues);
 	const valueRange = maxValue - minValue;
 	const nrmse = valueRange > 0 ? rmse / valueRange : NaN;
 
@@ -104,82 +100,40 @@ function analyzeLASCurve(filePath: string, curveName: string): CurveAnalysis {
 	try {
 		// Parse LAS file using our existing parser
 		const lasData: LASData = parseLASFile(filePath);
-
-		// Find the requested curve
-		const curve = lasData.curves.find(
-			(c) => c.name.toUpperCase() === curveName.toUpperCase(),
-		);
-
-		if (!curve) {
-			const availableCurves = lasData.curves.map((c) => c.name);
-			return {
-				curve: curveName,
-				error: `Curve '${curveName}' not found. Available curves: ${availableCurves.join(", ")}`,
-				availableCurves,
-				totalPoints: 0,
-				validPoints: 0,
-				minValue: 0,
-				maxValue: 0,
-				meanValue: 0,
-				depthStart: 0,
-				depthStop: 0,
-				depthStep: 0,
-			};
-		}
-
-		// Get valid data points (filter out NaN)
-		const validData = curve.data.filter((v) => !Number.isNaN(v));
-
-		if (validData.length === 0) {
-			return {
-				curve: curveName,
-				error: `No valid data points for curve '${curveName}'`,
-				totalPoints: curve.data.length,
-				validPoints: 0,
-				minValue: 0,
-				maxValue: 0,
-				meanValue: 0,
-				depthStart: lasData.depth_start,
-				depthStop: lasData.depth_stop,
-				depthStep: lasData.depth_step,
-			};
-		}
-
-		// Calculate basic statistics
-		const minValue = Math.min(...validData);
-		const maxValue = Math.max(...validData);
-		const meanValue =
-			validData.reduce((sum, v) => sum + v, 0) / validData.length;
-
-		const analysis: CurveAnalysis = {
+		return analyzeCurve(lasData, curveName);
+	} catch (error) {
+		return {
 			curve: curveName,
-			totalPoints: curve.data.length,
-			validPoints: validData.length,
-			minValue,
-			maxValue,
-			meanValue,
-			depthStart: lasData.depth_start,
-			depthStop: lasData.depth_stop,
-			depthStep: lasData.depth_step,
+			error: `Failed to analyze LAS file: ${error}`,
+			totalPoints: 0,
+			validPoints: 0,
+			minValue: 0,
+			maxValue: 0,
+			meanValue: 0,
+			depthStart: 0,
+			depthStop: 0,
+			depthStep: 0,
 		};
+	}
+}
 
-		// Create fitted curve and compute QC metrics
-		if (validData.length > 1) {
-			const fittedValues = createLinearFit(curve.data);
-			const qcMetrics = computeRMSE_NRMSE(curve.data, fittedValues);
-
-			analysis.rmse = qcMetrics.rmse;
-			analysis.nrmse = qcMetrics.nrmse;
-		} else {
-			analysis.rmse = 0;
-			analysis.nrmse = 0;
-		}
-
-		return analysis;
-	} catch (error) {
+/**
+ * Analyze a specific curve in already-parsed LAS data.
+ * Callers that QC several curves from one file should parse once and call this
+ * per curve — re-parsing the file for every curve dominates the QC cost.
+ */
+function analyzeCurve(lasData: LASData, curveName: string): CurveAnalysis {
+	// Find the requested curve
+	const curve = lasData.curves.find(
+		(c) => c.name.toUpperCase() === curveName.toUpperCase(),
+	);
+
+	if (!curve) {
+		const availableCurves = lasData.curves.map((c) => c.name);
 		return {
 			curve: curveName,
-			error: `Failed to analyze LAS file: ${error}`,
+			error: `Curve '${curveName}' not found. Available curves: ${availableCurves.join(", ")}`,
+			availableCurves,
 			totalPoints: 0,
 			validPoints: 0,
 			minValue: 0,
@@ -190,6 +144,63 @@ function analyzeLASCurve(filePath: string, curveName: string): CurveAnalysis {
 			depthStep: 0,
 		};
 	}
+
+	// Statistics over valid (non-NaN) points in one pass — no filtered copy, and
+	// no Math.min/max spread, which overflows the call stack on long curves
+	let validPoints = 0;
+	let minValue = Infinity;
+	let maxValue = -Infinity;
+	let sum = 0;
+	for (const v of curve.data) {
+		if (Number.isNaN(v)) continue;
+		validPoints++;
+		sum += v;
+		if (v < minValue) minValue = v;
+		if (v > maxValue) maxValue = v;
+	}
+
+	if (validPoints === 0) {
+		return {
+			curve: curveName,
+			error: `No valid data points for curve '${curveName}'`,
+			totalPoints: curve.data.length,
+			validPoints: 0,
+			minValue: 0,
+			maxValue: 0,
+			meanValue: 0,
+			depthStart: lasData.depth_start,
+			depthStop: lasData.depth_stop,
+			depthStep: lasData.depth_step,
+		};
+	}
+
+	const meanValue = sum / validPoints;
+
+	const analysis: CurveAnalysis = {
+		curve: curveName,
+		totalPoints: curve.data.length,
+		validPoints,
+		minValue,
+		maxValue,
+		meanValue,
+		depthStart: lasData.depth_start,
+		depthStop: lasData.depth_stop,
+		depthStep: lasData.depth_step,
+	};
+
+	// Create fitted curve and compute QC metrics
+	if (validPoints > 1) {
+		const fittedValues = createLinearFit(curve.data);
+		const qcMetrics = computeRMSE_NRMSE(curve.data, fittedValues);
+
+		analysis.rmse = qcMetrics.rmse;
+		analysis.nrmse = qcMetrics.nrmse;
+	} else {
+		analysis.rmse = 0;
+		analysis.nrmse = 0;
+	}
+
+	return analysis;
 }
 
 /**
@@ -239,6 +250,7 @@ if (import.meta.url === `file://${process.argv[1]}`) {
 }
 
 export {
+	analyzeCurve,
 	analyzeLASCurve,
 	computeRMSE_NRMSE,
 	type CurveAnalysis,
@@ -165,9 +165,17 @@ export function fitHyperbolicDecline(
 	let bestDi = 0.1;
 	let bestR2 = 0;
 
+	// The observed mean and total sum of squares do not depend on Di, so they
+	// are computed once; each grid step then fuses the prediction into a single
+	// residual pass instead of building a predicted array and rescanning q
+	const ssTot = totalSumOfSquares(q);
+
 	for (let Di = 0.05; Di <= 2.0; Di += 0.05) {
-		const predicted = t.map((ti) => qi / (1 + b * Di * ti) ** (1 / b));
-		const r2 = calculateR2(q, predicted);
+		let ssRes = 0;
+		for (let i = 0; i < q.length; i++) {
+			ssRes += (q[i] - qi / (1 + b * Di * t[i]) ** (1 / b)) ** 2;
+		}
+		const r2 = 1 - ssRes / ssTot;
 
 		if (r2 > bestR2) {
 			bestR2 = r2;
@@ -218,16 +226,12 @@ export function fitHyperbolicDecline(
 }
 
 /**
- * Calculate coefficient of determination (R²)
+ * Total sum of squares about the mean — the fit-independent denominator of the
+ * coefficient of determination, R² = 1 - SS_res / SS_tot
  */
-function calculateR2(observed: number[], predicted: number[]): number {
+function totalSumOfSquares(observed: number[]): number {
 	const mean = observed.reduce((sum, val) => sum + val, 0) / observed.length;
-	const ss_tot = observed.reduce((sum, val) => sum + (val - mean) ** 2, 0);
-	const ss_res = observed.reduce(
-		(sum, val, i) => sum + (val - predicted[i]) ** 2,
-		0,
-	);
-	return 1 - ss_res / ss_tot;
+	return observed.reduce((sum, val) => sum + (val - mean) ** 2, 0);
 }
 
 /**
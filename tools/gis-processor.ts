@@ -8,7 +8,7 @@
  * Users responsible for compliance with data licensing requirements.
  */
 
-import { access, readFile, stat } from "node:fs/promises";
+import { access, readdir, readFile, stat } from "node:fs/promises";
 import * as path from "node:path";
 import * as turf from "@turf/turf";
 import type { Feature as GeoJSONFeature } from "geojson";
@@ -390,8 +390,10 @@ export class EnhancedGISProcessor {
 			{ path: `${basePath}.shx`, name: ".shx file" },
 		];
 
+		// One directory listing instead of an access() round trip per component
+		const present = await this.listDirectory(path.dirname(shpPath));
 		for (const file of requiredFiles) {
-			if (!(await this.fileExists(file.path))) {
+			if (!present.has(path.basename(file.path))) {
 				errors.push(`Missing ${file.name}: ${file.path}`);
 			}
 		}
@@ -734,6 +736,14 @@ export class EnhancedGISProcessor {
 		}
 	}
 
+	private async listDirectory(dirPath: string): Promise<Set<string>> {
+		try {
+			return new Set(await readdir(dirPath));
+		} catch {
+			return new Set();
+		}
+	}
+
 	private parsePRJFile(prjContent: string): string {
 		const match = prjContent.match(/PROJCS\["([^"]+)"|GEOGCS\["([^"]+)/);
 		if (match) {
@@ -466,28 +466,42 @@ async function analyzeSeismicData(
 		interpretationNotes: [] as string[],
 	};
 
-	// Calculate amplitude statistics
-	let allAmplitudes: number[] = [];
-	traces.forEach((trace) => {
-		allAmplitudes = allAmplitudes.concat(trace.data);
-	});
+	// Calculate amplitude statistics in one pass over every trace's samples,
+	// instead of concatenating them into a growing array (quadratic in the trace
+	// count) and spreading it into Math.min/Math.max (overflows the argument
+	// stack on real surveys)
+	let count = 0;
+	let sumAbs = 0;
+	let sumSquares = 0;
+	let maxAmplitude = -Infinity;
+	let minAmplitude = Infinity;
+	let positive = 0;
+	let negative = 0;
+	let neutral = 0;
+	for (const trace of traces) {
+		for (const amp of trace.data) {
+			count++;
+			sumAbs += Math.abs(amp);
+			sumSquares += amp * amp;
+			maxAmplitude = Math.max(maxAmplitude, amp);
+			minAmplitude = Math.min(minAmplitude, amp);
+			if (amp > 0.1) positive++;
+			if (amp < -0.1) negative++;
+			if (Math.abs(amp) <= 0.1) neutral++;
+		}
+	}
 
 	analysis.amplitudeAnalysis = {
-		averageAmplitude:
-			allAmplitudes.reduce((sum, amp) => sum + Math.abs(amp), 0) /
-			allAmplitudes.length,
-		maxAmplitude: Math.max(...allAmplitudes),
-		minAmplitude: Math.min(...allAmplitudes),
-		rmsAmplitude: Math.sqrt(
-			allAmplitudes.reduce((sum, amp) => sum + amp * amp, 0) /
-				allAmplitudes.length,
-		),
+		averageAmplitude: sumAbs / count,
+		maxAmplitude,
+		minAmplitude,
+		rmsAmplitude: Math.sqrt(sumSquares / count),
 		brightSpots: 0,
 		dimSpots: 0,
 		amplitudeDistribution: {
-			positive: allAmplitudes.filter((amp) => amp > 0.1).length,
-			negative: allAmplitudes.filter((amp) => amp < -0.1).length,
-			neutral: allAmplitudes.filter((amp) => Math.abs(amp) <= 0.1).length,
+			positive,
+			negative,
+			neutral,
 		},
 	};
 
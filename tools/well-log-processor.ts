@@ -267,8 +267,17 @@ function parseWITSMLContent(xmlContent: string): WellLogData {
 }
 
 // Helper functions
+
+// Compiled once per tag name — the curve loop asks for the same tags on every
+// <logCurveInfo>. Non-global patterns, so reuse carries no lastIndex state.
+const xmlValuePatterns = new Map<string, RegExp>();
+
 function extractXMLValue(xmlContent: string, tagName: string): string | null {
-	const regex = new RegExp(`<${tagName}[^>]*>([^<]+)</${tagName}>`, "i");
+	let regex = xmlValuePatterns.get(tagName);
+	if (!regex) {
+		regex = new RegExp(`<${tagName}[^>]*>([^<]+)</${tagName}>`, "i");
+		xmlValuePatterns.set(tagName, regex);
+	}
 	const match = regex.exec(xmlContent);
 	return match ? match[1].trim() : null;
 }
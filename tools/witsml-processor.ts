@@ -287,8 +287,20 @@ function extractLogData(
 }
 
 // Helper functions
+
+// Tag patterns are compiled once per tag name and reused: extractCurves() asks
+// for the same three or four tags on every <logCurveInfo>, so building a fresh
+// RegExp per lookup dominated header parsing on logs with many curves.
+// The patterns are non-global, so sharing them carries no lastIndex state.
+const tagValuePatterns = new Map<string, RegExp>();
+const attributePatterns = new Map<string, RegExp>();
+
 function extractValue(xmlContent: string, tagName: string): string | null {
-	const regex = new RegExp(`<${tagName}[^>]*>([^<]+)</${tagName}>`, "i");
+	let regex = tagValuePatterns.get(tagName);
+	if (!regex) {
+		regex = new RegExp(`<${tagName}[^>]*>([^<]+)</${tagName}>`, "i");
+		tagValuePatterns.set(tagName, regex);
+	}
 	const match = regex.exec(xmlContent);
 	return match ? match[1].trim() : null;
 }
@@ -298,10 +310,15 @@ function extractAttribute(
 	tagName: string,
 	attributeName: string,
 ): string | null {
-	const regex = new RegExp(
-		`<${tagName}[^>]*${attributeName}="([^"]*)"[^>]*>`,
-		"i",
-	);
+	const key = `${tagName}@${attributeName}`;
+	let regex = attributePatterns.get(key);
+	if (!regex) {
+		regex = new RegExp(
+			`<${tagName}[^>]*${attributeName}="([^"]*)"[^>]*>`,
+			"i",
+		);
+		attributePatterns.set(key, regex);
+	}
 	const match = regex.exec(xmlContent);
 	return match ? match[1] : null;
 }